@@ -1,14 +1,24 @@
 """Gmail OAuth token validation for MCP Server."""
 
 import logging
+import time
 from typing import Optional, Dict, Any
 import httpx
 from pydantic import BaseModel
 
 from mcp.server.auth.provider import AccessToken, TokenVerifier
 
+from ..core.http import get_http_client
+
 logger = logging.getLogger(__name__)
 
+# Tokens Google rejected are answered from memory for this long before re-checking
+REJECTED_TOKEN_TTL_SECONDS = 60
+REJECTED_TOKEN_CACHE_SIZE = 1024
+
+# tokeninfo statuses that mean the token itself is invalid
+REJECTED_TOKEN_STATUSES = frozenset({400, 401, 403})
+
 
 class TokenInfo(BaseModel):
     """Token information from Gmail OAuth validation."""
@@ -23,42 +33,78 @@ class TokenInfo(BaseModel):
 class TokenValidator:
     """Gmail OAuth token validator."""
 
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """Initialize token validator.
+
+        Args:
+            http_client: HTTP client to use; defaults to the shared Google API client
+        """
         self.validation_url = "https://www.googleapis.com/oauth2/v1/tokeninfo"
+        self.http_client = http_client
+        self._rejected_tokens: Dict[str, float] = {}
+
+    def get_http_client(self) -> httpx.AsyncClient:
+        """Return the HTTP client used for token validation."""
+        return self.http_client or get_http_client()
+
+    def _is_rejected(self, token: str) -> bool:
+        """Check whether Google rejected this token within the cache window."""
+        rejected_until = self._rejected_tokens.get(token)
+        if rejected_until is None:
+            return False
+        if rejected_until > time.monotonic():
+            return True
+        del self._rejected_tokens[token]
+        return False
+
+    def _reject(self, token: str) -> None:
+        """Remember a token Google rejected so repeat requests skip the round trip."""
+        if len(self._rejected_tokens) >= REJECTED_TOKEN_CACHE_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del self._rejected_tokens[next(iter(self._rejected_tokens))]
+        self._rejected_tokens[token] = time.monotonic() + REJECTED_TOKEN_TTL_SECONDS
 
     async def validate_token(self, token: str) -> Optional[TokenInfo]:
         """Validate Gmail OAuth token.
 
+        Tokens that Google rejects are cached for a short window, so clients
+        retrying with a bad token don't trigger a tokeninfo call each time.
+
         Args:
             token: OAuth access token
 
         Returns:
             TokenInfo if valid, None if invalid
         """
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self.validation_url, params={"access_token": token}, timeout=10.0
-                )
+        if self._is_rejected(token):
+            return None
 
-                if response.status_code != 200:
-                    return None
+        try:
+            client = self.get_http_client()
+            response = await client.get(
+                self.validation_url, params={"access_token": token}, timeout=10.0
+            )
 
-                data = response.json()
+            if response.status_code != 200:
+                # Only these are a verdict on the token; 408/429 and 5xx may be transient
+                if response.status_code in REJECTED_TOKEN_STATUSES:
+                    self._reject(token)
+                return None
 
-                # Ensure it's a Gmail token
-                scope = data.get("scope", "")
-                if "gmail" not in scope.lower():
-                    return None
+            data = response.json()
 
-                print("Data is: ", data)
+            # Ensure it's a Gmail token
+            scope = data.get("scope", "")
+            if "gmail" not in scope.lower():
+                self._reject(token)
+                return None
 
-                return TokenInfo(
-                    access_token=token,
-                    email=data.get("email", ""),
-                    scope=scope,
-                    expires_in=data.get("expires_in"),
-                )
+            return TokenInfo(
+                access_token=token,
+                email=data.get("email", ""),
+                scope=scope,
+                expires_in=data.get("expires_in"),
+            )
 
         except Exception as e:
             logger.error(f"Token validation error: {e}")
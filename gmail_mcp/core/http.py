@@ -0,0 +1,33 @@
+"""Shared HTTP client for Google API calls."""
+
+from typing import Optional
+
+import httpx
+
+
+# One connection pool for every Google API call, so TLS sessions to
+# googleapis.com are reused across tool calls and users
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use.
+
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+async def aclose_http_client() -> None:
+    """Close the shared HTTP client and its connection pool."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
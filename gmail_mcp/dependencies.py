@@ -1,66 +1,209 @@
 """Dependency injection functions for MCP tools."""
 
-from typing import List, Optional
-from fastapi import HTTPException, Depends
+import hashlib
+from functools import lru_cache
+from typing import Iterable, Optional, Sequence, Tuple
+from cachetools import TTLCache
+from fastapi import HTTPException
 from mcp.server.fastmcp.server import Context
 from starlette.requests import Request
+from starlette.types import Scope
 
 from gmail_mcp.auth import TokenInfo
 
 from .services import GmailService
 
 
-def get_access_token(ctx: Context) -> str:
-    """Extract access token from MCP context.
+# Google OAuth access tokens are valid for at most one hour, so cached services
+# expire well within a token's lifetime and are evicted LRU beyond the size cap.
+SERVICE_CACHE_SIZE = 512
+SERVICE_CACHE_TTL_SECONDS = 1800
+
+# Keyed by the SHA-256 digest of the access token so raw tokens aren't kept
+# around as cache keys
+_service_cache: TTLCache = TTLCache(maxsize=SERVICE_CACHE_SIZE, ttl=SERVICE_CACHE_TTL_SECONDS)
+
+# Number of recipients spelled out in result messages
+RECIPIENTS_PREVIEW_LIMIT = 3
+
+
+def _request_scope(ctx: Context) -> Scope:
+    """Get the ASGI scope of the HTTP request behind an MCP context.
 
     Args:
         ctx: MCP context containing request information
 
     Returns:
-        Access token string
+        ASGI scope dictionary
 
     Raises:
-        HTTPException: If no valid token is found
+        HTTPException: If no request is available
     """
     if not ctx or not ctx.request_context:
         raise HTTPException(status_code=401, detail="No request context available")
 
-    request: Request = ctx.request_context.request
-    auth_header = request.headers.get("Authorization")
-
-    if not auth_header or not auth_header.startswith("Bearer "):
+    request: Optional[Request] = ctx.request_context.request
+    if request is None:
         raise HTTPException(status_code=401, detail="No valid access token provided")
 
-    return auth_header.replace("Bearer ", "")
+    return request.scope
 
 
-def get_gmail_service(access_token: str = Depends(get_access_token)) -> GmailService:
-    """Get GmailService instance with access token.
+def bearer_token_from_headers(headers: Iterable[Tuple[bytes, bytes]]) -> Optional[str]:
+    """Extract the bearer token from raw ASGI headers.
+
+    Scans the header pairs directly instead of building Starlette's Headers object.
+
+    Args:
+        headers: Raw ASGI header (name, value) pairs
+
+    Returns:
+        Access token string, or None if there is no Bearer Authorization header
+    """
+    for name, value in headers:
+        if name == b"authorization":
+            if value[:7] == b"Bearer ":
+                return value[7:].decode("latin-1")
+            break
+    return None
+
+
+def _token_from_scope(scope: Scope) -> str:
+    """Extract the bearer token from an ASGI scope.
+
+    Uses the token stored by GmailAuthMiddleware when present, otherwise reads
+    it from the raw headers.
+
+    Args:
+        scope: ASGI scope of the request
+
+    Returns:
+        Access token string
+
+    Raises:
+        HTTPException: If no valid token is found
+    """
+    token = scope.get("gmail_token") or bearer_token_from_headers(scope["headers"])
+    if token:
+        return token
+
+    raise HTTPException(status_code=401, detail="No valid access token provided")
+
+
+def _service_for(access_token: str) -> GmailService:
+    """Get the cached GmailService for an access token, building it if needed.
+
+    A cached service that Gmail answered with 401 is replaced by a fresh
+    instance, so its coalescers and unauthorized flag start over. The new
+    instance still uses the same token, so a revoked or expired token will
+    fail again.
 
     Args:
         access_token: OAuth access token
 
+    Returns:
+        Cached GmailService instance
+    """
+    key = hashlib.sha256(access_token.encode()).digest()
+    gmail_service = _service_cache.get(key)
+    if gmail_service is None or gmail_service.unauthorized:
+        token_info = TokenInfo(
+            access_token=access_token,
+            email="",  # Email can be fetched if needed
+            scope="",  # Scope can be fetched if needed
+        )
+        gmail_service = _service_cache[key] = GmailService(token_info=token_info)
+    return gmail_service
+
+
+async def get_gmail_service(ctx: Context) -> GmailService:
+    """Get GmailService instance for the current request.
+
+    Services are cached per token, so repeated tool calls with the same token
+    reuse the same instance and its coalescers, and the resolved service is
+    memoized on the request scope.
+
+    Args:
+        ctx: MCP context containing request information
+
     Returns:
         Configured GmailService instance
+
+    Raises:
+        HTTPException: If no valid token is found
     """
-    token_info = TokenInfo(
-        access_token=access_token,
-        email="",  # Email can be fetched if needed
-        scope="",  # Scope can be fetched if needed
-    )
-    return GmailService(token_info=token_info)
-    
+    scope = _request_scope(ctx)
+    gmail_service = scope.get("gmail_service")
+    if gmail_service is None:
+        gmail_service = _service_for(_token_from_scope(scope))
+        scope["gmail_service"] = gmail_service
+    return gmail_service
+
+
+@lru_cache(maxsize=2048)
+def parse_comma_separated_list(value: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Parse comma-separated string into a tuple of strings.
+
+    Results are cached, so the same recipient or label list is only split once.
+    A tuple is returned so cached results can't be mutated by callers.
 
-def parse_comma_separated_list(value: Optional[str]) -> Optional[List[str]]:
-    """Parse comma-separated string into a list of strings.
-    
     Args:
         value: Comma-separated string or None
-        
+
     Returns:
-        List of strings or None
+        Tuple of strings or None
     """
-    if value is None or value.strip() == "":
+    if not value:
         return None
-    # Split by comma and strip whitespace from each item
-    return [item.strip() for item in value.split(',') if item.strip()]
\ No newline at end of file
+
+    # Split by comma and strip each item once, dropping empty entries
+    items = []
+    for raw_item in value.split(","):
+        item = raw_item.strip()
+        if item:
+            items.append(item)
+    return tuple(items) or None
+
+
+def parse_recipient_lists(
+    to: Optional[str], cc: Optional[str], bcc: Optional[str]
+) -> Tuple[Optional[Tuple[str, ...]], ...]:
+    """Parse to/cc/bcc comma-separated strings in one call.
+
+    Empty fields short-circuit before touching the parser cache, and each
+    non-empty field is served from the cache when it was seen before.
+
+    Args:
+        to: Recipient email addresses
+        cc: CC recipients
+        bcc: BCC recipients
+
+    Returns:
+        Tuple of (to, cc, bcc) parsed lists, each a tuple of strings or None
+    """
+    return (
+        parse_comma_separated_list(to) if to else None,
+        parse_comma_separated_list(cc) if cc else None,
+        parse_comma_separated_list(bcc) if bcc else None,
+    )
+
+
+def recipients_preview(recipients: Optional[Sequence[str]]) -> str:
+    """Format recipients for a human-readable result message.
+
+    Only the first RECIPIENTS_PREVIEW_LIMIT addresses are joined, so large
+    recipient lists don't produce long messages.
+
+    Args:
+        recipients: Parsed recipient addresses or None
+
+    Returns:
+        Comma-separated preview, e.g. "a@x.com, b@x.com, c@x.com (+2 more)"
+    """
+    if not recipients:
+        return "recipients"
+
+    preview = ", ".join(recipients[:RECIPIENTS_PREVIEW_LIMIT])
+    if len(recipients) > RECIPIENTS_PREVIEW_LIMIT:
+        preview += f" (+{len(recipients) - RECIPIENTS_PREVIEW_LIMIT} more)"
+    return preview
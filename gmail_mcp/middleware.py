@@ -0,0 +1,32 @@
+"""ASGI middleware for MCP tools."""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .dependencies import bearer_token_from_headers
+
+
+class GmailAuthMiddleware:
+    """Pure ASGI middleware that extracts the Gmail bearer token once per request.
+
+    The token is read straight from the raw ASGI headers and stored on the scope
+    as ``gmail_token`` so tools don't have to re-parse the Authorization header.
+    The matching GmailService is resolved lazily by get_gmail_service and
+    memoized on the scope as ``gmail_service``, so requests rejected by the
+    auth layer never build one.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """Initialize middleware.
+
+        Args:
+            app: ASGI application to wrap
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            token = bearer_token_from_headers(scope["headers"])
+            if token:
+                scope["gmail_token"] = token
+
+        await self.app(scope, receive, send)
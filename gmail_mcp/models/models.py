@@ -151,7 +151,7 @@ class Profile(BaseModel):
 class SendEmailRequest(BaseModel):
     """Request model for sending emails."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     to: List[str] = Field(..., description="Recipient email addresses")
     cc: Optional[List[str]] = Field(None, description="CC recipients")
@@ -215,7 +215,7 @@ class EmailListRequest(BaseModel):
 class ModifyLabelsRequest(BaseModel):
     """Request model for modifying message labels."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     add_label_ids: Optional[List[str]] = Field(None, description="Label IDs to add")
     remove_label_ids: Optional[List[str]] = Field(None, description="Label IDs to remove")
@@ -224,7 +224,7 @@ class ModifyLabelsRequest(BaseModel):
 class CreateLabelRequest(BaseModel):
     """Request model for creating labels."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     name: str = Field(..., description="Label name")
     message_list_visibility: str = Field(default="show", description="Message list visibility")
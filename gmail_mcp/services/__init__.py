@@ -1,3 +1,4 @@
-from .gmail_service import GmailService
+from .gmail_service import GmailAPIError, GmailService
+from .coalescer import BatchCoalescer, FetchCoalescer
 
-__all__ = ["GmailService"]
+__all__ = ["GmailService", "GmailAPIError", "BatchCoalescer", "FetchCoalescer"]
@@ -0,0 +1,155 @@
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+# One submit() call: its own IDs and the future it waits on
+_Submission = Tuple[List[str], "asyncio.Future[None]"]
+
+# Merged IDs, submissions and flush timer of a batch that is still collecting IDs
+_PendingBatch = Tuple[List[str], List[_Submission], asyncio.TimerHandle]
+
+
+class FetchCoalescer:
+    """Coalesce concurrent fetches of the same Gmail resource.
+
+    A fetch that arrives while an identical one is still in flight awaits the
+    same task instead of issuing another round trip to the Gmail API.
+    """
+
+    def __init__(self) -> None:
+        """Initialize coalescer with no fetches in flight."""
+        self._in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def fetch(self, key: Hashable, fetcher: Callable[[], Awaitable[T]]) -> T:
+        """Fetch a resource, sharing the result with identical concurrent calls.
+
+        Args:
+            key: Identity of the resource, e.g. ("thread", thread_id, format)
+            fetcher: Callable starting the actual fetch
+
+        Returns:
+            Result of the shared fetch
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetcher())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        # Shield so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(future)
+
+
+class BatchCoalescer(Generic[K]):
+    """Merge concurrent batch operations that share a key into one call.
+
+    IDs submitted under the same key are buffered until either ``max_batch``
+    IDs are pending or ``max_wait`` seconds have passed since the first one,
+    then flushed together. If a merged flush fails with an error that
+    ``split_on`` attributes to specific IDs, each submitter's IDs are retried
+    in a flush of their own, so one caller's bad ID can't fail the others.
+    Any other error is passed to every submitter of the merged flush.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[K, List[str]], Awaitable[None]],
+        max_batch: int = 100,
+        max_wait: float = 0.005,
+        split_on: Optional[Callable[[Exception], bool]] = None,
+    ):
+        """Initialize coalescer.
+
+        Args:
+            flush: Coroutine function performing one batch call for a key
+            max_batch: Number of pending IDs that triggers an immediate flush
+            max_wait: Seconds to wait for more IDs before flushing
+            split_on: Predicate telling whether a failed merged flush should be
+                retried per submitter; merged failures are never split if omitted
+        """
+        self._flush = flush
+        self._split_on = split_on
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._pending: Dict[K, _PendingBatch] = {}
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def submit(self, key: K, ids: List[str]) -> None:
+        """Queue IDs for the next batch call under ``key`` and wait for it.
+
+        Args:
+            key: Identity of the operation; only IDs with equal keys are merged
+            ids: IDs to include in the batch
+        """
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(key)
+        if pending is None:
+            timer = loop.call_later(self.max_wait, self._start_flush, key)
+            pending = self._pending[key] = ([], [], timer)
+
+        waiter = loop.create_future()
+        pending[0].extend(ids)
+        pending[1].append((list(ids), waiter))
+        if len(pending[0]) >= self.max_batch:
+            self._start_flush(key)
+
+        await waiter
+
+    def _start_flush(self, key: K) -> None:
+        """Detach the pending batch for ``key`` and run its flush in a task."""
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+
+        ids, submissions, timer = pending
+        timer.cancel()
+        task = asyncio.create_task(self._run_flush(key, ids, submissions))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_flush(
+        self, key: K, ids: List[str], submissions: List[_Submission]
+    ) -> None:
+        """Run one batch call and resolve every waiter with its outcome."""
+        try:
+            await self._flush(key, ids)
+        except Exception as e:
+            if len(submissions) == 1 or self._split_on is None or not self._split_on(e):
+                for _, waiter in submissions:
+                    self._resolve(waiter, e)
+            else:
+                # The failure is tied to some caller's IDs; retry each caller alone
+                await asyncio.gather(
+                    *(
+                        self._run_flush(key, own_ids, [(own_ids, waiter)])
+                        for own_ids, waiter in submissions
+                    )
+                )
+        else:
+            for _, waiter in submissions:
+                self._resolve(waiter, None)
+
+    @staticmethod
+    def _resolve(waiter: "asyncio.Future[None]", error: Optional[Exception]) -> None:
+        """Complete a waiter with ``error``, or successfully if it is None."""
+        if waiter.done():
+            return
+        if error is None:
+            waiter.set_result(None)
+        else:
+            waiter.set_exception(error)
@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import base64
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -6,11 +6,11 @@ from email.mime.base import MIMEBase
 from email import encoders
 import os
 from datetime import datetime
+import asyncio
 import logging
+from urllib.parse import quote
 
-from googleapiclient.discovery import build
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
+import httpx
 from pydantic import BaseModel
 
 from ..models import (
@@ -38,10 +38,44 @@ from ..models import (
     DraftListResponse,
 )
 from ..auth import TokenInfo
+from ..core.http import get_http_client
+from .coalescer import BatchCoalescer, FetchCoalescer
 
 
 logger = logging.getLogger(__name__)
 
+GMAIL_API_URL = "https://gmail.googleapis.com/gmail/v1/users/me"
+
+# Gmail's users.messages.batchModify accepts at most this many IDs per call
+BATCH_MODIFY_MAX_IDS = 1000
+
+# Label change shared by merged batchModify calls: (label IDs to add, label IDs to remove)
+LabelChangeKey = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+
+class GmailAPIError(Exception):
+    """Error response from the Gmail API."""
+
+    def __init__(self, status_code: int, message: str):
+        """Initialize error.
+
+        Args:
+            status_code: HTTP status code returned by Gmail
+            message: Gmail's error message, e.g. "Requested entity was not found."
+        """
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+
+
+def _is_message_id_error(error: Exception) -> bool:
+    """Check whether a batchModify failure may be caused by individual message IDs.
+
+    Gmail answers 400 for malformed IDs and 404 for unknown ones. Other errors
+    (auth, rate limits, server errors) would hit every request alike.
+    """
+    return isinstance(error, GmailAPIError) and error.status_code in (400, 404)
+
 
 class GmailService:
     """Gmail API service wrapper."""
@@ -53,8 +87,63 @@ class GmailService:
             token_info: Valid token information
         """
         self.token_info = token_info
-        self.credentials = Credentials(token=token_info.access_token)
-        self.service = build("gmail", "v1", credentials=self.credentials)
+        self._headers = {"Authorization": f"Bearer {token_info.access_token}"}
+        # Set once Gmail answers 401, so cached instances can be discarded
+        self.unauthorized = False
+        self.coalescer = FetchCoalescer()
+        self.batch_modifier: BatchCoalescer[LabelChangeKey] = BatchCoalescer(
+            self._flush_batch_modify, split_on=_is_message_id_error
+        )
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Send an authorized request to the Gmail REST API.
+
+        Args:
+            method: HTTP method
+            path: Path below users/me, e.g. "/messages"
+            params: Query parameters; list values are sent as repeated keys
+            json: JSON request body
+
+        Returns:
+            Decoded JSON response, or an empty dict for empty responses
+
+        Raises:
+            GmailAPIError: If Gmail returns an error status
+        """
+        response = await get_http_client().request(
+            method, GMAIL_API_URL + path, params=params, json=json, headers=self._headers
+        )
+        if response.status_code >= 400:
+            if response.status_code == 401:
+                self.unauthorized = True
+            raise GmailAPIError(response.status_code, self._error_message(response))
+        if not response.content:
+            return {}
+        return response.json()
+
+    @staticmethod
+    def _error_message(response: httpx.Response) -> str:
+        """Extract Gmail's error message from an error response.
+
+        Args:
+            response: Gmail API response with an error status
+
+        Returns:
+            Gmail's message when the body has one, otherwise a generic description
+        """
+        try:
+            message = response.json()["error"]["message"]
+        except (ValueError, KeyError, TypeError):
+            message = None
+        if isinstance(message, str) and message:
+            return message
+        return f"Gmail API request failed with status {response.status_code}"
 
     def _parse_message_headers(self, headers: List[Dict[str, str]]) -> Dict[str, str]:
         """Parse message headers into a dictionary.
@@ -216,7 +305,7 @@ class GmailService:
             Profile object
         """
         try:
-            profile = self.service.users().getProfile(userId="me").execute()
+            profile = await self._request("GET", "/profile")
             return Profile(
                 email_address=profile["emailAddress"],
                 messages_total=profile["messagesTotal"],
@@ -278,8 +367,7 @@ class GmailService:
             EmailListResponse with messages
         """
         try:
-            query_params = {
-                "userId": "me",
+            query_params: Dict[str, Any] = {
                 "maxResults": request.max_results,
                 "includeSpamTrash": request.include_spam_trash,
             }
@@ -306,7 +394,7 @@ class GmailService:
             if request.page_token:
                 query_params["pageToken"] = request.page_token
 
-            result = self.service.users().messages().list(**query_params).execute()
+            result = await self._request("GET", "/messages", params=query_params)
 
             messages = []
             for msg in result.get("messages", []):
@@ -316,11 +404,10 @@ class GmailService:
                     gmail_api_format = "full"  # Get headers but not full body data
 
                 # Get message details with specified format
-                full_msg = (
-                    self.service.users()
-                    .messages()
-                    .get(userId="me", id=msg["id"], format=gmail_api_format)
-                    .execute()
+                full_msg = await self._request(
+                    "GET",
+                    f"/messages/{quote(msg['id'], safe='')}",
+                    params={"format": gmail_api_format},
                 )
                 messages.append(self._parse_message(full_msg, format))
 
@@ -349,17 +436,54 @@ class GmailService:
             if format == "compact":
                 gmail_api_format = "full"  # Get headers but not full body data
 
-            msg_data = (
-                self.service.users()
-                .messages()
-                .get(userId="me", id=message_id, format=gmail_api_format)
-                .execute()
+            msg_data = await self._request(
+                "GET",
+                f"/messages/{quote(message_id, safe='')}",
+                params={"format": gmail_api_format},
             )
             return self._parse_message(msg_data, format)
         except Exception as e:
             logger.error(f"Error getting message {message_id}: {e}")
             raise
 
+    async def get_message_headers(
+        self, message_id: str, headers: Tuple[str, ...] = ("From", "Subject")
+    ) -> Message:
+        """Get a message's ID fields and selected headers without its body.
+
+        Uses the metadata format restricted to ``headers``, so Gmail returns
+        neither the body nor other headers and nothing has to be decoded.
+
+        Args:
+            message_id: Message ID
+            headers: Header names to fetch
+
+        Returns:
+            Message with subject, sender and recipient set from the fetched headers
+        """
+        try:
+            msg_data = await self._request(
+                "GET",
+                f"/messages/{quote(message_id, safe='')}",
+                params={"format": "metadata", "metadataHeaders": list(headers)},
+            )
+            parsed_headers = self._parse_message_headers(
+                msg_data.get("payload", {}).get("headers", [])
+            )
+            return Message(
+                id=msg_data["id"],
+                thread_id=msg_data["threadId"],
+                label_ids=msg_data.get("labelIds", []),
+                snippet=msg_data.get("snippet"),
+                history_id=msg_data.get("historyId"),
+                subject=parsed_headers.get("subject"),
+                sender=parsed_headers.get("from"),
+                recipient=parsed_headers.get("to"),
+            )
+        except Exception as e:
+            logger.error(f"Error getting headers of message {message_id}: {e}")
+            raise
+
     async def search_messages(
         self,
         request: SearchEmailsRequest,
@@ -389,8 +513,7 @@ class GmailService:
 
             final_query = " ".join(query_parts)
 
-            query_params = {
-                "userId": "me",
+            query_params: Dict[str, Any] = {
                 "q": final_query,
                 "maxResults": request.max_results,
                 "includeSpamTrash": request.include_spam_trash,
@@ -401,7 +524,7 @@ class GmailService:
             if request.page_token:
                 query_params["pageToken"] = request.page_token
 
-            result = self.service.users().messages().list(**query_params).execute()
+            result = await self._request("GET", "/messages", params=query_params)
 
             messages = []
             for msg in result.get("messages", []):
@@ -410,11 +533,10 @@ class GmailService:
                 if format == MessageFormat.COMPACT:
                     gmail_api_format = "full"  # Get headers but not full body data
 
-                full_msg = (
-                    self.service.users()
-                    .messages()
-                    .get(userId="me", id=msg["id"], format=gmail_api_format)
-                    .execute()
+                full_msg = await self._request(
+                    "GET",
+                    f"/messages/{quote(msg['id'], safe='')}",
+                    params={"format": gmail_api_format},
                 )
                 messages.append(self._parse_message(full_msg, format.__str__()))
 
@@ -491,7 +613,7 @@ class GmailService:
             if request.thread_id:
                 send_request["threadId"] = request.thread_id
 
-            result = self.service.users().messages().send(userId="me", body=send_request).execute()
+            result = await self._request("POST", "/messages/send", json=send_request)
 
             return result["id"]
         except Exception as e:
@@ -515,11 +637,8 @@ class GmailService:
             if request.remove_label_ids:
                 modify_request["removeLabelIds"] = request.remove_label_ids
 
-            result = (
-                self.service.users()
-                .messages()
-                .modify(userId="me", id=message_id, body=modify_request)
-                .execute()
+            result = await self._request(
+                "POST", f"/messages/{quote(message_id, safe='')}/modify", json=modify_request
             )
 
             return self._parse_message(result)
@@ -527,6 +646,55 @@ class GmailService:
             logger.error(f"Error modifying message labels: {e}")
             raise
 
+    async def batch_modify_messages(
+        self, message_ids: List[str], request: ModifyLabelsRequest
+    ) -> None:
+        """Modify labels of many messages with Gmail's batchModify endpoint.
+
+        Concurrent calls that apply the same label change are merged by the
+        batch coalescer, so a burst of single-message updates becomes one
+        request.
+
+        Args:
+            message_ids: Message IDs to modify
+            request: Label modification request applied to every message
+        """
+        key = (tuple(request.add_label_ids or ()), tuple(request.remove_label_ids or ()))
+        await self.batch_modifier.submit(key, message_ids)
+
+    async def _flush_batch_modify(self, key: LabelChangeKey, message_ids: List[str]) -> None:
+        """Send one merged label change to Gmail's batchModify endpoint.
+
+        IDs are sent in chunks of BATCH_MODIFY_MAX_IDS, one round trip per chunk,
+        and the chunks are issued concurrently.
+
+        Args:
+            key: Tuple of (label IDs to add, label IDs to remove)
+            message_ids: Message IDs to modify
+        """
+        try:
+            add_label_ids, remove_label_ids = key
+            modify_request = {}
+            if add_label_ids:
+                modify_request["addLabelIds"] = list(add_label_ids)
+            if remove_label_ids:
+                modify_request["removeLabelIds"] = list(remove_label_ids)
+
+            async def modify_chunk(chunk: List[str]) -> None:
+                await self._request(
+                    "POST", "/messages/batchModify", json={"ids": chunk, **modify_request}
+                )
+
+            await asyncio.gather(
+                *(
+                    modify_chunk(message_ids[i : i + BATCH_MODIFY_MAX_IDS])
+                    for i in range(0, len(message_ids), BATCH_MODIFY_MAX_IDS)
+                )
+            )
+        except Exception as e:
+            logger.error(f"Error batch modifying message labels: {e}")
+            raise
+
     async def delete_message(self, message_id: str) -> bool:
         """Delete a message.
 
@@ -537,7 +705,7 @@ class GmailService:
             True if successful
         """
         try:
-            self.service.users().messages().delete(userId="me", id=message_id).execute()
+            await self._request("DELETE", f"/messages/{quote(message_id, safe='')}")
             return True
         except Exception as e:
             logger.error(f"Error deleting message: {e}")
@@ -550,7 +718,7 @@ class GmailService:
             LabelListResponse with labels
         """
         try:
-            result = self.service.users().labels().list(userId="me").execute()
+            result = await self._request("GET", "/labels")
 
             labels = []
             for label_data in result.get("labels", []):
@@ -588,7 +756,7 @@ class GmailService:
                 "labelListVisibility": request.label_list_visibility,
             }
 
-            result = self.service.users().labels().create(userId="me", body=label_object).execute()
+            result = await self._request("POST", "/labels", json=label_object)
 
             return Label(
                 id=result["id"],
@@ -669,12 +837,7 @@ class GmailService:
             # Encode and send
             raw_message = base64.urlsafe_b64encode(msg.as_bytes()).decode("utf-8")
 
-            result = (
-                self.service.users()
-                .messages()
-                .send(userId="me", body={"raw": raw_message})
-                .execute()
-            )
+            result = await self._request("POST", "/messages/send", json={"raw": raw_message})
 
             return result["id"]
         except Exception as e:
@@ -706,8 +869,7 @@ class GmailService:
             # Combine all query parts
             final_query = " ".join(search_query_parts) if search_query_parts else None
 
-            query_params = {
-                "userId": "me",
+            query_params: Dict[str, Any] = {
                 "maxResults": request.max_results,
                 "includeSpamTrash": request.include_spam_trash,
             }
@@ -719,7 +881,7 @@ class GmailService:
             if request.page_token:
                 query_params["pageToken"] = request.page_token
 
-            result = self.service.users().threads().list(**query_params).execute()
+            result = await self._request("GET", "/threads", params=query_params)
 
             gmail_api_format = request.message_format.__str__()
             if gmail_api_format == "compact":
@@ -728,11 +890,10 @@ class GmailService:
             threads = []
             for thread_data in result.get("threads", []):
                 # Get full thread details
-                full_thread = (
-                    self.service.users()
-                    .threads()
-                    .get(userId="me", id=thread_data["id"], format=gmail_api_format)
-                    .execute()
+                full_thread = await self._request(
+                    "GET",
+                    f"/threads/{quote(thread_data['id'], safe='')}",
+                    params={"format": gmail_api_format},
                 )
 
                 messages = []
@@ -776,11 +937,8 @@ class GmailService:
             if gmail_api_format == MessageFormat.COMPACT.__str__():
                 gmail_api_format = "full"
             # Get full thread details
-            full_thread = (
-                self.service.users()
-                .threads()
-                .get(userId="me", id=thread_id, format=gmail_api_format)
-                .execute()
+            full_thread = await self._request(
+                "GET", f"/threads/{quote(thread_id, safe='')}", params={"format": gmail_api_format}
             )
 
             # Parse messages
@@ -842,7 +1000,7 @@ class GmailService:
             if request.thread_id:
                 draft_request["message"]["threadId"] = request.thread_id
 
-            result = self.service.users().drafts().create(userId="me", body=draft_request).execute()
+            result = await self._request("POST", "/drafts", json=draft_request)
 
             return result["id"]
         except Exception as e:
@@ -881,12 +1039,12 @@ class GmailService:
                 after_date = None
                 before_date = None
 
-            query_params = {"userId": "me", "maxResults": max_results}
+            query_params: Dict[str, Any] = {"maxResults": max_results}
 
             if page_token:
                 query_params["pageToken"] = page_token
 
-            result = self.service.users().drafts().list(**query_params).execute()
+            result = await self._request("GET", "/drafts", params=query_params)
 
             gmail_api_format = format.__str__()
             if gmail_api_format == MessageFormat.COMPACT:
@@ -895,11 +1053,10 @@ class GmailService:
             drafts = []
             for draft_data in result.get("drafts", []):
                 # Get full draft details
-                full_draft = (
-                    self.service.users()
-                    .drafts()
-                    .get(userId="me", id=draft_data["id"], format=gmail_api_format)
-                    .execute()
+                full_draft = await self._request(
+                    "GET",
+                    f"/drafts/{quote(draft_data['id'], safe='')}",
+                    params={"format": gmail_api_format},
                 )
 
                 message = self._parse_message(full_draft["message"], format.__str__())
@@ -966,11 +1123,8 @@ class GmailService:
                 gmail_api_format = MessageFormat.FULL.__str__()
 
             # Get full draft details
-            full_draft = (
-                self.service.users()
-                .drafts()
-                .get(userId="me", id=draft_id, format=gmail_api_format)
-                .execute()
+            full_draft = await self._request(
+                "GET", f"/drafts/{quote(draft_id, safe='')}", params={"format": gmail_api_format}
             )
 
             message = self._parse_message(full_draft["message"], format.__str__())
@@ -991,9 +1145,7 @@ class GmailService:
             Message ID of sent email
         """
         try:
-            result = (
-                self.service.users().drafts().send(userId="me", body={"id": draft_id}).execute()
-            )
+            result = await self._request("POST", "/drafts/send", json={"id": draft_id})
 
             return result["id"]
         except Exception as e:
@@ -1011,12 +1163,9 @@ class GmailService:
             AttachmentData with downloaded content
         """
         try:
-            attachment = (
-                self.service.users()
-                .messages()
-                .attachments()
-                .get(userId="me", messageId=message_id, id=attachment_id)
-                .execute()
+            message_path = f"/messages/{quote(message_id, safe='')}"
+            attachment = await self._request(
+                "GET", f"{message_path}/attachments/{quote(attachment_id, safe='')}"
             )
 
             return AttachmentData(
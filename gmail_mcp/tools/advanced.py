@@ -1,18 +1,80 @@
-from typing import Optional, List
-import json
+from typing import Any, Coroutine, Dict, Optional, List, Tuple
+import asyncio
 import logging
+import uuid
 
+import orjson
+from pydantic import TypeAdapter
 from mcp.server import FastMCP
 from fastapi import HTTPException
 from mcp.server.fastmcp.server import Context
 
 from ..services import GmailService
-from ..models import ForwardEmailRequest, CreateDraftRequest, MessageFormat, ThreadListRequest
-from ..dependencies import get_access_token, get_gmail_service, parse_comma_separated_list
+from ..models import (
+    AttachmentData,
+    CreateDraftRequest,
+    Draft,
+    DraftListRequest,
+    ForwardEmailRequest,
+    MessageFormat,
+    ModifyLabelsRequest,
+    Thread,
+    ThreadListRequest,
+)
+from ..dependencies import (
+    get_gmail_service,
+    parse_comma_separated_list,
+    parse_recipient_lists,
+    recipients_preview,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Adapters that encode model lists straight to JSON bytes in pydantic-core
+_threads_adapter = TypeAdapter(List[Thread])
+_drafts_adapter = TypeAdapter(List[Draft])
+_attachments_adapter = TypeAdapter(List[AttachmentData])
+
+
+# How long a finished background result is kept for gmail_await_future
+FUTURE_RESULT_TTL_SECONDS = 600
+
+# How long gmail_await_future waits before reporting the operation as still pending
+FUTURE_WAIT_TIMEOUT_SECONDS = 30
+
+# Background write operations keyed by future ID: (owner access token, task)
+_pending: Dict[str, Tuple[str, "asyncio.Task[str]"]] = {}
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result to an indented JSON string."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode()
+
+
+def _start_background(gmail_service: GmailService, operation: Coroutine[Any, Any, str]) -> str:
+    """Run a write operation in the background and return a future handle.
+
+    Args:
+        gmail_service: Service of the caller that owns the operation
+        operation: Tool coroutine producing the final JSON result
+
+    Returns:
+        JSON string with the future ID to pass to gmail_await_future
+    """
+    future_id = uuid.uuid4().hex
+    task = asyncio.create_task(operation)
+    _pending[future_id] = (gmail_service.token_info.access_token, task)
+
+    def _expire(_: "asyncio.Task[str]") -> None:
+        # Drop results nobody collected so the registry can't grow unbounded
+        asyncio.get_running_loop().call_later(
+            FUTURE_RESULT_TTL_SECONDS, _pending.pop, future_id, None
+        )
+
+    task.add_done_callback(_expire)
+    return _dumps({"success": True, "future_id": future_id, "status": "pending"})
+
 
 def register_advanced_tools(mcp: FastMCP):
     """Register advanced Gmail tools with MCP server.
@@ -29,6 +91,7 @@ def register_advanced_tools(mcp: FastMCP):
         cc: Optional[str] = None,
         bcc: Optional[str] = None,
         additional_message: Optional[str] = None,
+        background: bool = False,
     ) -> str:
         """Forward an email to other recipients.
 
@@ -38,24 +101,34 @@ def register_advanced_tools(mcp: FastMCP):
             cc: CC recipients (comma-separated string)
             bcc: BCC recipients (comma-separated string)
             additional_message: Additional message to include with forward
+            background: Return a future_id immediately and forward in the background
             ctx: MCP context for logging and progress
 
         Returns:
             JSON string with forward status and message ID
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        if background:
+            return _start_background(
+                gmail_service,
+                gmail_forward_email(
+                    ctx,
+                    message_id=message_id,
+                    to=to,
+                    cc=cc,
+                    bcc=bcc,
+                    additional_message=additional_message,
+                ),
+            )
         try:
             # Parse comma-separated strings into lists
-            to_list = parse_comma_separated_list(to)
-            cc_list = parse_comma_separated_list(cc)
-            bcc_list = parse_comma_separated_list(bcc)
+            to_list, cc_list, bcc_list = parse_recipient_lists(to, cc, bcc)
 
             # Forward the email using the Gmail service
             request = ForwardEmailRequest(
-                to=to_list,
-                cc=cc_list,
-                bcc=bcc_list,
+                to=list(to_list) if to_list else None,
+                cc=list(cc_list) if cc_list else None,
+                bcc=list(bcc_list) if bcc_list else None,
                 additional_message=additional_message,
             )
 
@@ -65,14 +138,14 @@ def register_advanced_tools(mcp: FastMCP):
                 "success": True,
                 "forwarded_message_id": forwarded_message_id,
                 "original_message_id": message_id,
-                "message": f"Email forwarded successfully to {', '.join(to_list) if to_list else 'recipients'}",
+                "message": f"Email forwarded successfully to {recipients_preview(to_list)}",
             }
 
-            return json.dumps(result, indent=2)
+            return _dumps(result)
 
         except Exception as e:
-            logger.error(f"Error in forward_email: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+            logger.error("Error in forward_email: %s", e)
+            return _dumps({"error": str(e), "success": False})
 
     @mcp.tool()
     async def gmail_move_to_folder(
@@ -80,6 +153,7 @@ def register_advanced_tools(mcp: FastMCP):
         message_id: str,
         folder_label_id: str,
         remove_inbox: bool = True,
+        background: bool = False,
     ) -> str:
         """Move an email to a specific folder/label.
 
@@ -87,26 +161,31 @@ def register_advanced_tools(mcp: FastMCP):
             message_id: Message ID to move
             folder_label_id: Target folder/label ID (e.g., 'TRASH', 'SPAM', or custom label ID)
             remove_inbox: Whether to remove from INBOX when moving
+            background: Return a future_id immediately and move in the background
             ctx: MCP context for logging and progress
 
         Returns:
             JSON string with move status
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        if background:
+            return _start_background(
+                gmail_service,
+                gmail_move_to_folder(
+                    ctx,
+                    message_id=message_id,
+                    folder_label_id=folder_label_id,
+                    remove_inbox=remove_inbox,
+                ),
+            )
         try:
-
-            from ..models import ModifyLabelsRequest
-
-            add_labels = [folder_label_id]
-            remove_labels = []
-
-            if remove_inbox and folder_label_id not in ["INBOX"]:
-                remove_labels.append("INBOX")
+            remove_labels = None
+            if remove_inbox and folder_label_id != "INBOX":
+                remove_labels = ["INBOX"]
 
             request = ModifyLabelsRequest(
-                add_label_ids=add_labels,
-                remove_label_ids=remove_labels if remove_labels else None,
+                add_label_ids=[folder_label_id],
+                remove_label_ids=remove_labels,
             )
 
             updated_message = await gmail_service.modify_message_labels(message_id, request)
@@ -119,11 +198,11 @@ def register_advanced_tools(mcp: FastMCP):
                 "message": f"Email moved to {folder_label_id}",
             }
 
-            return json.dumps(result, indent=2)
+            return _dumps(result)
 
         except Exception as e:
-            logger.error(f"Error in move_to_folder: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+            logger.error("Error in move_to_folder: %s", e)
+            return _dumps({"error": str(e), "success": False})
 
     @mcp.tool()
     async def gmail_get_threads(
@@ -151,8 +230,7 @@ def register_advanced_tools(mcp: FastMCP):
         Returns:
             JSON string with threads list
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = await get_gmail_service(ctx)
         try:
             # GmailService is injected via dependency injection
             
@@ -161,7 +239,7 @@ def register_advanced_tools(mcp: FastMCP):
 
             request = ThreadListRequest(
                 max_results=max_results,
-                label_ids=label_ids_list,
+                label_ids=list(label_ids_list) if label_ids_list else None,
                 q=query,
                 include_spam_trash=include_spam_trash,
                 page_token=page_token,
@@ -172,17 +250,17 @@ def register_advanced_tools(mcp: FastMCP):
             response = await gmail_service.list_threads(request)
 
             result = {
-                "threads": [thread.model_dump() for thread in response.threads],
+                "threads": orjson.Fragment(_threads_adapter.dump_json(response.threads)),
                 "next_page_token": response.next_page_token,
                 "result_size_estimate": response.result_size_estimate,
                 "count": len(response.threads),
             }
 
-            return json.dumps(result, indent=2, default=str)
+            return _dumps(result)
 
         except Exception as e:
-            logger.error(f"Error in get_threads: {e}")
-            return json.dumps({"error": str(e)}, indent=2)
+            logger.error("Error in get_threads: %s", e)
+            return _dumps({"error": str(e)})
 
     @mcp.tool()
     async def gmail_get_thread_by_id(
@@ -200,22 +278,24 @@ def register_advanced_tools(mcp: FastMCP):
         Returns:
             JSON string with thread details
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = await get_gmail_service(ctx)
         try:
-            thread = await gmail_service.get_thread(thread_id, format)
+            thread = await gmail_service.coalescer.fetch(
+                ("thread", thread_id, format),
+                lambda: gmail_service.get_thread(thread_id, format),
+            )
 
             result = {
                 "success": True,
-                "thread": thread.model_dump(),
+                "thread": orjson.Fragment(thread.model_dump_json()),
                 "message_count": len(thread.messages),
             }
 
-            return json.dumps(result, indent=2, default=str)
+            return _dumps(result)
 
         except Exception as e:
-            logger.error(f"Error in get_thread_by_id: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+            logger.error("Error in get_thread_by_id: %s", e)
+            return _dumps({"error": str(e), "success": False})
 
     @mcp.tool()
     async def gmail_create_draft(
@@ -228,6 +308,7 @@ def register_advanced_tools(mcp: FastMCP):
         bcc: Optional[str] = None,
         thread_id: Optional[str] = None,
         in_reply_to: Optional[str] = None,
+        background: bool = False,
     ) -> str:
         """Create a draft email.
 
@@ -240,30 +321,43 @@ def register_advanced_tools(mcp: FastMCP):
             bcc: BCC recipients (comma-separated string)
             thread_id: Thread ID for replies
             in_reply_to: Message ID being replied to
+            background: Return a future_id immediately and create the draft in the background
             ctx: MCP context for logging and progress
 
         Returns:
             JSON string with draft creation status
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        if background:
+            return _start_background(
+                gmail_service,
+                gmail_create_draft(
+                    ctx,
+                    to=to,
+                    subject=subject,
+                    body_text=body_text,
+                    body_html=body_html,
+                    cc=cc,
+                    bcc=bcc,
+                    thread_id=thread_id,
+                    in_reply_to=in_reply_to,
+                ),
+            )
         try:
             if not body_text and not body_html:
-                return json.dumps({"error": "Either body_text or body_html must be provided"})
+                return _dumps({"error": "Either body_text or body_html must be provided"})
 
             # Parse comma-separated strings into lists
-            to_list = parse_comma_separated_list(to)
-            cc_list = parse_comma_separated_list(cc)
-            bcc_list = parse_comma_separated_list(bcc)
+            to_list, cc_list, bcc_list = parse_recipient_lists(to, cc, bcc)
 
             # GmailService is injected via dependency injection
             request = CreateDraftRequest(
-                to=to_list,
+                to=list(to_list) if to_list else None,
                 subject=subject,
                 body_text=body_text,
                 body_html=body_html,
-                cc=cc_list,
-                bcc=bcc_list,
+                cc=list(cc_list) if cc_list else None,
+                bcc=list(bcc_list) if bcc_list else None,
                 thread_id=thread_id,
                 in_reply_to=in_reply_to,
             )
@@ -273,14 +367,14 @@ def register_advanced_tools(mcp: FastMCP):
             result = {
                 "success": True,
                 "draft_id": draft_id,
-                "message": f"Draft created successfully for {', '.join(to_list) if to_list else 'recipients'}",
+                "message": f"Draft created successfully for {recipients_preview(to_list)}",
             }
 
-            return json.dumps(result, indent=2)
+            return _dumps(result)
 
         except Exception as e:
-            logger.error(f"Error in create_draft: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+            logger.error("Error in create_draft: %s", e)
+            return _dumps({"error": str(e), "success": False})
 
     @mcp.tool()
     async def gmail_get_drafts(
@@ -306,12 +400,8 @@ def register_advanced_tools(mcp: FastMCP):
         Returns:
             JSON string containing drafts list
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = await get_gmail_service(ctx)
         try:
-            # Import DraftListRequest
-            from ..models import DraftListRequest
-
             request = DraftListRequest(
                 max_results=max_results,
                 page_token=page_token,
@@ -324,17 +414,17 @@ def register_advanced_tools(mcp: FastMCP):
             response = await gmail_service.list_drafts(request)
 
             result = {
-                "drafts": [draft.model_dump() for draft in response.drafts],
+                "drafts": orjson.Fragment(_drafts_adapter.dump_json(response.drafts)),
                 "next_page_token": response.next_page_token,
                 "result_size_estimate": response.result_size_estimate,
                 "count": len(response.drafts),
             }
 
-            return json.dumps(result, indent=2, default=str)
+            return _dumps(result)
 
         except Exception as e:
-            logger.error(f"Error in get_drafts: {e}")
-            return json.dumps({"error": str(e)}, indent=2)
+            logger.error("Error in get_drafts: %s", e)
+            return _dumps({"error": str(e)})
 
     @mcp.tool()
     async def gmail_get_draft_by_id(
@@ -352,39 +442,44 @@ def register_advanced_tools(mcp: FastMCP):
         Returns:
             JSON string with draft details
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = await get_gmail_service(ctx)
         try:
-            draft = await gmail_service.get_draft(draft_id, format)
+            draft = await gmail_service.coalescer.fetch(
+                ("draft", draft_id, format),
+                lambda: gmail_service.get_draft(draft_id, format),
+            )
 
             result = {
                 "success": True,
-                "draft": draft.model_dump(),
+                "draft": orjson.Fragment(draft.model_dump_json()),
                 "message": f"Draft {draft_id} retrieved successfully",
             }
 
-            return json.dumps(result, indent=2, default=str)
+            return _dumps(result)
 
         except Exception as e:
-            logger.error(f"Error in get_draft_by_id: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+            logger.error("Error in get_draft_by_id: %s", e)
+            return _dumps({"error": str(e), "success": False})
 
     @mcp.tool()
     async def gmail_send_draft(
         ctx: Context,
         draft_id: str,
+        background: bool = False,
     ) -> str:
         """Send an existing draft email.
 
         Args:
             draft_id: Draft ID to send
+            background: Return a future_id immediately and send in the background
             ctx: MCP context for logging and progress
 
         Returns:
             JSON string with send status and message ID
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        if background:
+            return _start_background(gmail_service, gmail_send_draft(ctx, draft_id=draft_id))
         try:
             # Send the draft email
 
@@ -397,11 +492,11 @@ def register_advanced_tools(mcp: FastMCP):
                 "message": "Draft sent successfully",
             }
 
-            return json.dumps(result, indent=2)
+            return _dumps(result)
 
         except Exception as e:
-            logger.error(f"Error in send_draft: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+            logger.error("Error in send_draft: %s", e)
+            return _dumps({"error": str(e), "success": False})
 
     @mcp.tool()
     async def gmail_get_attachments(
@@ -419,34 +514,72 @@ def register_advanced_tools(mcp: FastMCP):
         Returns:
             JSON string with attachment data or list of attachments
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = await get_gmail_service(ctx)
         try:
             # GmailService is injected via dependency injection
 
             if attachment_id:
                 # Download specific attachment
-                attachment = await gmail_service.get_attachment(message_id, attachment_id)
+                attachment = await gmail_service.coalescer.fetch(
+                    ("attachment", message_id, attachment_id),
+                    lambda: gmail_service.get_attachment(message_id, attachment_id),
+                )
 
                 result = {
                     "success": True,
-                    "attachment": attachment.model_dump(),
+                    "attachment": orjson.Fragment(attachment.model_dump_json()),
                     "message": f"Attachment {attachment_id} downloaded successfully",
                 }
             else:
                 # Get message to list all attachments
-                message = await gmail_service.get_message(message_id)
+                message = await gmail_service.coalescer.fetch(
+                    ("message", message_id),
+                    lambda: gmail_service.get_message(message_id),
+                )
 
                 result = {
                     "success": True,
                     "message_id": message_id,
-                    "attachments": [att.model_dump() for att in message.attachments],
+                    "attachments": orjson.Fragment(
+                        _attachments_adapter.dump_json(message.attachments)
+                    ),
                     "count": len(message.attachments),
                     "message": f"Found {len(message.attachments)} attachments",
                 }
 
-            return json.dumps(result, indent=2, default=str)
+            return _dumps(result)
 
         except Exception as e:
-            logger.error(f"Error in get_attachments: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+            logger.error("Error in get_attachments: %s", e)
+            return _dumps({"error": str(e), "success": False})
+
+    @mcp.tool()
+    async def gmail_await_future(
+        ctx: Context,
+        future_id: str,
+    ) -> str:
+        """Wait for a background operation and return its result.
+
+        Args:
+            future_id: Future ID returned by a tool called with background=True
+            ctx: MCP context for logging and progress
+
+        Returns:
+            JSON string with the result of the background operation, or a pending
+            status if it doesn't finish within FUTURE_WAIT_TIMEOUT_SECONDS
+        """
+        gmail_service: GmailService = await get_gmail_service(ctx)
+
+        pending = _pending.get(future_id)
+        if pending is None or pending[0] != gmail_service.token_info.access_token:
+            return _dumps({"error": f"Unknown future_id: {future_id}", "success": False})
+
+        # Shield the task so a timed out or cancelled wait doesn't cancel the operation
+        try:
+            result = await asyncio.wait_for(
+                asyncio.shield(pending[1]), timeout=FUTURE_WAIT_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            return _dumps({"success": True, "future_id": future_id, "status": "pending"})
+        _pending.pop(future_id, None)
+        return result
@@ -1,20 +1,143 @@
 """MCP tools for email sending and management operations."""
 
-from typing import Optional, List, Union
-import json
+from typing import Any, Awaitable, Callable, Dict, Optional, List
+import asyncio
+import functools
 import logging
 
+import orjson
 from mcp.server import FastMCP
 from fastapi import HTTPException
 from mcp.server.fastmcp.server import Context
 
 from ..services import GmailService
 from ..models import SendEmailRequest, ModifyLabelsRequest, CreateLabelRequest
-from ..dependencies import get_access_token, get_gmail_service, parse_comma_separated_list
+from ..dependencies import (
+    get_gmail_service,
+    parse_comma_separated_list,
+    parse_recipient_lists,
+    recipients_preview,
+)
 
 
 logger = logging.getLogger(__name__)
 
+_ToolFunc = Callable[..., Awaitable[str]]
+
+# Fixed label changes shared by the read/unread/archive tools, built once at import
+_REQ_MARK_READ = ModifyLabelsRequest(remove_label_ids=["UNREAD"])
+_REQ_MARK_UNREAD = ModifyLabelsRequest(add_label_ids=["UNREAD"])
+_REQ_ARCHIVE = ModifyLabelsRequest(remove_label_ids=["INBOX"])
+_REQ_UNARCHIVE = ModifyLabelsRequest(add_label_ids=["INBOX"])
+
+# Label changes accepted by gmail_bulk_operations, keyed by operation name
+_BULK_OPERATIONS = {
+    "read": _REQ_MARK_READ,
+    "unread": _REQ_MARK_UNREAD,
+    "archive": _REQ_ARCHIVE,
+    "unarchive": _REQ_UNARCHIVE,
+}
+
+# Subjects already starting with the marker are replied to unchanged
+_REPLY_MARKER = "Re:"
+_REPLY_PREFIX = "Re: "
+
+
+def _dump(obj: Any) -> str:
+    """Serialize a tool result to a compact JSON string."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _result_suffix(message: str) -> str:
+    """Pre-serialize the part of a single-message result following the ID."""
+    return '","message":' + orjson.dumps(message).decode() + "}"
+
+
+# Success results of the single-message tools, serialized once around the ID
+_RESULT_PREFIX = '{"success":true,"message_id":"'
+_MARKED_READ_SUFFIX = _result_suffix("Email marked as read")
+_MARKED_UNREAD_SUFFIX = _result_suffix("Email marked as unread")
+_ARCHIVED_SUFFIX = _result_suffix("Email archived successfully")
+_UNARCHIVED_SUFFIX = _result_suffix("Email unarchived successfully")
+_DELETED_SUFFIX = _result_suffix("Email deleted successfully")
+
+
+def _message_result(message_id: str, suffix: str) -> str:
+    """Build a single-message success result from its pre-serialized parts.
+
+    Produces the same string as _dump on the equivalent dict.
+
+    Args:
+        message_id: Message ID the operation was applied to
+        suffix: Pre-serialized remainder from _result_suffix
+
+    Returns:
+        JSON string with operation status
+    """
+    if message_id.isascii() and message_id.isalnum():
+        # Gmail IDs are hex strings, which never need JSON escaping
+        return _RESULT_PREFIX + message_id + suffix
+    return _RESULT_PREFIX[:-1] + orjson.dumps(message_id).decode() + suffix[1:]
+
+
+def mcp_tool_errors(name: str) -> Callable[[_ToolFunc], _ToolFunc]:
+    """Turn unexpected errors raised by a tool into a JSON error result.
+
+    HTTPExceptions (e.g. a missing token) still propagate, so the transport
+    can answer with the proper status code.
+
+    Args:
+        name: Tool name used in the error log
+
+    Returns:
+        Decorator wrapping an async tool function
+    """
+
+    def decorator(fn: _ToolFunc) -> _ToolFunc:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            try:
+                return await fn(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.error("Error in %s: %s", name, e)
+                return _dump({"error": str(e), "success": False})
+
+        return wrapper
+
+    return decorator
+
+
+async def _modify_labels_bulk(
+    gmail_service: GmailService, message_ids: str, request: ModifyLabelsRequest, action: str
+) -> str:
+    """Apply one label change to many messages via Gmail's batchModify endpoint.
+
+    Args:
+        gmail_service: GmailService instance
+        message_ids: Message IDs (comma-separated string)
+        request: Label modification request applied to every message
+        action: Past-tense description of the change for the result message
+
+    Returns:
+        JSON string with operation status
+    """
+    message_ids_list = parse_comma_separated_list(message_ids)
+    if not message_ids_list:
+        return _dump({"error": "No message IDs provided", "success": False})
+
+    await gmail_service.batch_modify_messages(list(message_ids_list), request)
+
+    result = {
+        "success": True,
+        "message_ids": message_ids_list,
+        "count": len(message_ids_list),
+        "message": f"{len(message_ids_list)} emails {action}",
+    }
+
+    return _dump(result)
+
 
 def register_management_tools(mcp: FastMCP):
     """Register email management tools with MCP server.
@@ -50,28 +173,26 @@ def register_management_tools(mcp: FastMCP):
         Returns:
             JSON string with send status and message ID
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = await get_gmail_service(ctx)
         try:
             if not body_text and not body_html:
-                return json.dumps({"error": "Either body_text or body_html must be provided"})
+                return _dump({"error": "Either body_text or body_html must be provided"})
 
-            # Parse comma-separated strings into lists
-            to_list = parse_comma_separated_list(to)
-            cc_list = parse_comma_separated_list(cc)
-            bcc_list = parse_comma_separated_list(bcc)
-            attachments_list = parse_comma_separated_list(attachments)
+            # Parse comma-separated strings, skipping the parser for empty fields
+            to_list, cc_list, bcc_list = parse_recipient_lists(to, cc, bcc)
+            attachments_list = parse_comma_separated_list(attachments) if attachments else None
+            if not to_list:
+                return _dump({"error": "At least one recipient must be provided"})
 
-            # GmailService is configured with the access token
-
-            request = SendEmailRequest(
-                to=to_list,
+            # Inputs are already typed strings and parsed tuples, so skip validation
+            request = SendEmailRequest.model_construct(
+                to=list(to_list),
                 subject=subject,
                 body_text=body_text,
                 body_html=body_html,
-                cc=cc_list,
-                bcc=bcc_list,
-                attachments=attachments_list,
+                cc=list(cc_list) if cc_list else None,
+                bcc=list(bcc_list) if bcc_list else None,
+                attachments=list(attachments_list) if attachments_list else None,
             )
 
             message_id = await gmail_service.send_message(request)
@@ -79,16 +200,17 @@ def register_management_tools(mcp: FastMCP):
             result = {
                 "success": True,
                 "message_id": message_id,
-                "message": f"Email sent successfully to {', '.join(to_list) if to_list else 'recipients'}",
+                "message": f"Email sent successfully to {recipients_preview(to_list)}",
             }
 
-            return json.dumps(result, indent=2)
+            return _dump(result)
 
         except Exception as e:
-            logger.error(f"Error sending email: {e}")
+            logger.error("Error in send_email: %s", e)
             raise HTTPException(status_code=500, detail=f"Failed to send email: {str(e)}")
 
     @mcp.tool()
+    @mcp_tool_errors("reply_to_email")
     async def gmail_reply_to_email(
         ctx: Context,
         message_id: str,
@@ -108,54 +230,49 @@ def register_management_tools(mcp: FastMCP):
         Returns:
             JSON string with reply status
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            if not body_text and not body_html:
-                return json.dumps({"error": "Either body_text or body_html must be provided"})
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        if not body_text and not body_html:
+            return _dump({"error": "Either body_text or body_html must be provided"})
 
-            # GmailService is injected via dependency injection
+        # GmailService is injected via dependency injection
 
-            # Get original message to extract reply info
-            original_message = await gmail_service.get_message(message_id)
+        # Only the sender, subject and thread are needed, so skip the body
+        original_message = await gmail_service.get_message_headers(message_id)
 
-            # Prepare reply
-            to_addresses = [original_message.sender] if original_message.sender else []
+        # Prepare reply
+        to_addresses = [original_message.sender] if original_message.sender else []
 
-            if reply_all and original_message.recipient:
-                # Add other recipients for reply-all (simplified)
-                # In production, you'd parse all To/CC recipients from headers
-                pass
+        if reply_all and original_message.recipient:
+            # Add other recipients for reply-all (simplified)
+            # In production, you'd parse all To/CC recipients from headers
+            pass
 
-            subject = original_message.subject or ""
-            if not subject.startswith("Re:"):
-                subject = f"Re: {subject}"
-
-            request = SendEmailRequest(
-                to=to_addresses,
-                subject=subject,
-                body_text=body_text,
-                body_html=body_html,
-                thread_id=original_message.thread_id,
-                in_reply_to=message_id,
-            )
+        subject = original_message.subject or ""
+        if subject[:3] != _REPLY_MARKER:
+            subject = _REPLY_PREFIX + subject
 
-            reply_message_id = await gmail_service.send_message(request)
+        request = SendEmailRequest.model_construct(
+            to=to_addresses,
+            subject=subject,
+            body_text=body_text,
+            body_html=body_html,
+            thread_id=original_message.thread_id,
+            in_reply_to=message_id,
+        )
 
-            result = {
-                "success": True,
-                "reply_message_id": reply_message_id,
-                "original_message_id": message_id,
-                "message": f"Reply sent successfully",
-            }
+        reply_message_id = await gmail_service.send_message(request)
 
-            return json.dumps(result, indent=2)
+        result = {
+            "success": True,
+            "reply_message_id": reply_message_id,
+            "original_message_id": message_id,
+            "message": f"Reply sent successfully",
+        }
 
-        except Exception as e:
-            logger.error(f"Error in reply_to_email: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+        return _dump(result)
 
     @mcp.tool()
+    @mcp_tool_errors("mark_as_read")
     async def gmail_mark_as_read(
         ctx: Context,
         message_id: str,
@@ -169,23 +286,14 @@ def register_management_tools(mcp: FastMCP):
         Returns:
             JSON string with operation status
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            # Mark message as read by removing UNREAD label
-
-            request = ModifyLabelsRequest(remove_label_ids=["UNREAD"])
-            await gmail_service.modify_message_labels(message_id, request)
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        # Mark message as read by removing UNREAD label
+        await gmail_service.batch_modify_messages([message_id], _REQ_MARK_READ)
 
-            result = {"success": True, "message_id": message_id, "message": "Email marked as read"}
-
-            return json.dumps(result, indent=2)
-
-        except Exception as e:
-            logger.error(f"Error in mark_as_read: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+        return _message_result(message_id, _MARKED_READ_SUFFIX)
 
     @mcp.tool()
+    @mcp_tool_errors("mark_as_unread")
     async def gmail_mark_as_unread(
         ctx: Context,
         message_id: str,
@@ -199,27 +307,14 @@ def register_management_tools(mcp: FastMCP):
         Returns:
             JSON string with operation status
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            # Mark message as unread by adding UNREAD label
-
-            request = ModifyLabelsRequest(add_label_ids=["UNREAD"])
-            await gmail_service.modify_message_labels(message_id, request)
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        # Mark message as unread by adding UNREAD label
+        await gmail_service.batch_modify_messages([message_id], _REQ_MARK_UNREAD)
 
-            result = {
-                "success": True,
-                "message_id": message_id,
-                "message": "Email marked as unread",
-            }
-
-            return json.dumps(result, indent=2)
-
-        except Exception as e:
-            logger.error(f"Error in mark_as_unread: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+        return _message_result(message_id, _MARKED_UNREAD_SUFFIX)
 
     @mcp.tool()
+    @mcp_tool_errors("archive_email")
     async def gmail_archive_email(
         ctx: Context,
         message_id: str,
@@ -233,27 +328,14 @@ def register_management_tools(mcp: FastMCP):
         Returns:
             JSON string with operation status
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            # Archive email by removing INBOX label
-
-            request = ModifyLabelsRequest(remove_label_ids=["INBOX"])
-            await gmail_service.modify_message_labels(message_id, request)
-
-            result = {
-                "success": True,
-                "message_id": message_id,
-                "message": "Email archived successfully",
-            }
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        # Archive email by removing INBOX label
+        await gmail_service.batch_modify_messages([message_id], _REQ_ARCHIVE)
 
-            return json.dumps(result, indent=2)
-
-        except Exception as e:
-            logger.error(f"Error in archive_email: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+        return _message_result(message_id, _ARCHIVED_SUFFIX)
 
     @mcp.tool()
+    @mcp_tool_errors("unarchive_email")
     async def gmail_unarchive_email(
         ctx: Context,
         message_id: str,
@@ -267,27 +349,14 @@ def register_management_tools(mcp: FastMCP):
         Returns:
             JSON string with operation status
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            # Unarchive email by adding INBOX label
-
-            request = ModifyLabelsRequest(add_label_ids=["INBOX"])
-            await gmail_service.modify_message_labels(message_id, request)
-
-            result = {
-                "success": True,
-                "message_id": message_id,
-                "message": "Email unarchived successfully",
-            }
-
-            return json.dumps(result, indent=2)
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        # Unarchive email by adding INBOX label
+        await gmail_service.batch_modify_messages([message_id], _REQ_UNARCHIVE)
 
-        except Exception as e:
-            logger.error(f"Error in unarchive_email: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+        return _message_result(message_id, _UNARCHIVED_SUFFIX)
 
     @mcp.tool()
+    @mcp_tool_errors("delete_email")
     async def gmail_delete_email(ctx: Context, message_id: str) -> str:
         """Delete an email permanently.
 
@@ -298,31 +367,22 @@ def register_management_tools(mcp: FastMCP):
         Returns:
             JSON string with operation status
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            success = await gmail_service.delete_message(message_id)
-
-            if success:
-                result = {
-                    "success": True,
-                    "message_id": message_id,
-                    "message": "Email deleted successfully",
-                }
-            else:
-                result = {
-                    "success": False,
-                    "message_id": message_id,
-                    "message": "Failed to delete email",
-                }
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        success = await gmail_service.delete_message(message_id)
 
-            return json.dumps(result, indent=2)
+        if success:
+            return _message_result(message_id, _DELETED_SUFFIX)
 
-        except Exception as e:
-            logger.error(f"Error in delete_email: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+        result = {
+            "success": False,
+            "message_id": message_id,
+            "message": "Failed to delete email",
+        }
+
+        return _dump(result)
 
     @mcp.tool()
+    @mcp_tool_errors("add_label")
     async def gmail_add_label(ctx: Context, message_id: str, label_ids: str) -> str:
         """Add labels to an email.
 
@@ -334,29 +394,26 @@ def register_management_tools(mcp: FastMCP):
         Returns:
             JSON string with operation status
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            # Parse comma-separated string into list
-            label_ids_list = parse_comma_separated_list(label_ids)
-            request = ModifyLabelsRequest(add_label_ids=label_ids_list)
-            updated_message = await gmail_service.modify_message_labels(message_id, request)
-
-            result = {
-                "success": True,
-                "message_id": message_id,
-                "added_labels": label_ids_list,
-                "current_labels": updated_message.label_ids,
-                "message": f"Labels {', '.join(label_ids_list) if label_ids_list else 'none'} added successfully",
-            }
-
-            return json.dumps(result, indent=2)
-
-        except Exception as e:
-            logger.error(f"Error in add_label: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        # Parse comma-separated string into list
+        label_ids_list = parse_comma_separated_list(label_ids)
+        request = ModifyLabelsRequest.model_construct(
+            add_label_ids=list(label_ids_list) if label_ids_list else None
+        )
+        updated_message = await gmail_service.modify_message_labels(message_id, request)
+
+        result = {
+            "success": True,
+            "message_id": message_id,
+            "added_labels": label_ids_list,
+            "current_labels": updated_message.label_ids,
+            "message": f"Labels {', '.join(label_ids_list) if label_ids_list else 'none'} added successfully",
+        }
+
+        return _dump(result)
 
     @mcp.tool()
+    @mcp_tool_errors("remove_label")
     async def gmail_remove_label(ctx: Context, message_id: str, label_ids: str) -> str:
         """Remove labels from an email.
 
@@ -368,29 +425,188 @@ def register_management_tools(mcp: FastMCP):
         Returns:
             JSON string with operation status
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            # Parse comma-separated string into list
-            label_ids_list = parse_comma_separated_list(label_ids)
-            request = ModifyLabelsRequest(remove_label_ids=label_ids_list)
-            updated_message = await gmail_service.modify_message_labels(message_id, request)
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        # Parse comma-separated string into list
+        label_ids_list = parse_comma_separated_list(label_ids)
+        request = ModifyLabelsRequest.model_construct(
+            remove_label_ids=list(label_ids_list) if label_ids_list else None
+        )
+        updated_message = await gmail_service.modify_message_labels(message_id, request)
+
+        result = {
+            "success": True,
+            "message_id": message_id,
+            "removed_labels": label_ids_list,
+            "current_labels": updated_message.label_ids,
+            "message": f"Labels {', '.join(label_ids_list) if label_ids_list else 'none'} removed successfully",
+        }
+
+        return _dump(result)
 
-            result = {
-                "success": True,
-                "message_id": message_id,
-                "removed_labels": label_ids_list,
-                "current_labels": updated_message.label_ids,
-                "message": f"Labels {', '.join(label_ids_list) if label_ids_list else 'none'} removed successfully",
-            }
+    @mcp.tool()
+    @mcp_tool_errors("mark_as_read_bulk")
+    async def gmail_mark_as_read_bulk(ctx: Context, message_ids: str) -> str:
+        """Mark many emails as read with a single batch request.
 
-            return json.dumps(result, indent=2)
+        Args:
+            message_ids: Message IDs to mark as read (comma-separated string)
+            ctx: MCP context for logging and progress
 
-        except Exception as e:
-            logger.error(f"Error in remove_label: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+        Returns:
+            JSON string with operation status
+        """
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        return await _modify_labels_bulk(
+            gmail_service, message_ids, _REQ_MARK_READ, "marked as read"
+        )
+
+    @mcp.tool()
+    @mcp_tool_errors("mark_as_unread_bulk")
+    async def gmail_mark_as_unread_bulk(ctx: Context, message_ids: str) -> str:
+        """Mark many emails as unread with a single batch request.
+
+        Args:
+            message_ids: Message IDs to mark as unread (comma-separated string)
+            ctx: MCP context for logging and progress
+
+        Returns:
+            JSON string with operation status
+        """
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        return await _modify_labels_bulk(
+            gmail_service, message_ids, _REQ_MARK_UNREAD, "marked as unread"
+        )
+
+    @mcp.tool()
+    @mcp_tool_errors("archive_email_bulk")
+    async def gmail_archive_email_bulk(ctx: Context, message_ids: str) -> str:
+        """Archive many emails (remove from INBOX) with a single batch request.
+
+        Args:
+            message_ids: Message IDs to archive (comma-separated string)
+            ctx: MCP context for logging and progress
+
+        Returns:
+            JSON string with operation status
+        """
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        return await _modify_labels_bulk(gmail_service, message_ids, _REQ_ARCHIVE, "archived")
+
+    @mcp.tool()
+    @mcp_tool_errors("unarchive_email_bulk")
+    async def gmail_unarchive_email_bulk(ctx: Context, message_ids: str) -> str:
+        """Unarchive many emails (add back to INBOX) with a single batch request.
+
+        Args:
+            message_ids: Message IDs to unarchive (comma-separated string)
+            ctx: MCP context for logging and progress
+
+        Returns:
+            JSON string with operation status
+        """
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        return await _modify_labels_bulk(
+            gmail_service, message_ids, _REQ_UNARCHIVE, "unarchived"
+        )
 
     @mcp.tool()
+    @mcp_tool_errors("add_label_bulk")
+    async def gmail_add_label_bulk(ctx: Context, message_ids: str, label_ids: str) -> str:
+        """Add labels to many emails with a single batch request.
+
+        Args:
+            message_ids: Message IDs (comma-separated string)
+            label_ids: Label IDs to add (comma-separated string)
+            ctx: MCP context for logging and progress
+
+        Returns:
+            JSON string with operation status
+        """
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        label_ids_list = parse_comma_separated_list(label_ids)
+        if not label_ids_list:
+            return _dump({"error": "No label IDs provided", "success": False})
+
+        request = ModifyLabelsRequest.model_construct(add_label_ids=list(label_ids_list))
+        return await _modify_labels_bulk(gmail_service, message_ids, request, "labeled")
+
+    @mcp.tool()
+    @mcp_tool_errors("remove_label_bulk")
+    async def gmail_remove_label_bulk(ctx: Context, message_ids: str, label_ids: str) -> str:
+        """Remove labels from many emails with a single batch request.
+
+        Args:
+            message_ids: Message IDs (comma-separated string)
+            label_ids: Label IDs to remove (comma-separated string)
+            ctx: MCP context for logging and progress
+
+        Returns:
+            JSON string with operation status
+        """
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        label_ids_list = parse_comma_separated_list(label_ids)
+        if not label_ids_list:
+            return _dump({"error": "No label IDs provided", "success": False})
+
+        request = ModifyLabelsRequest.model_construct(remove_label_ids=list(label_ids_list))
+        return await _modify_labels_bulk(gmail_service, message_ids, request, "unlabeled")
+
+    @mcp.tool()
+    @mcp_tool_errors("bulk_operations")
+    async def gmail_bulk_operations(ctx: Context, operations_json: str) -> str:
+        """Apply mixed read/unread/archive/unarchive operations to many emails at once.
+
+        Operations are grouped by type and each group is sent as one batch
+        request, with all groups running concurrently.
+
+        Args:
+            operations_json: JSON list of {"op": "read"|"unread"|"archive"|"unarchive",
+                "message_id": "..."} objects
+            ctx: MCP context for logging and progress
+
+        Returns:
+            JSON string with one result per operation type
+        """
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        try:
+            operations = orjson.loads(operations_json)
+        except orjson.JSONDecodeError as e:
+            return _dump({"error": f"Invalid operations JSON: {e}", "success": False})
+        if not isinstance(operations, list):
+            return _dump({"error": "operations_json must be a JSON list", "success": False})
+
+        # Group message IDs by operation so each group is a single batchModify call
+        groups: Dict[str, List[str]] = {}
+        for operation in operations:
+            if isinstance(operation, dict):
+                op, message_id = operation.get("op"), operation.get("message_id")
+            else:
+                op = message_id = None
+            if op not in _BULK_OPERATIONS or not isinstance(message_id, str) or not message_id:
+                return _dump({"error": f"Invalid operation: {operation}", "success": False})
+            groups.setdefault(op, []).append(message_id)
+
+        async def run_group(op: str, message_ids: List[str]) -> Dict[str, Any]:
+            # Report failures per group so one failing group doesn't cancel the others
+            try:
+                await gmail_service.batch_modify_messages(message_ids, _BULK_OPERATIONS[op])
+            except Exception as e:
+                logger.error("Error in bulk_operations (%s): %s", op, e)
+                return {"op": op, "message_ids": message_ids, "success": False, "error": str(e)}
+            return {"op": op, "message_ids": message_ids, "success": True}
+
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [
+                task_group.create_task(run_group(op, message_ids))
+                for op, message_ids in groups.items()
+            ]
+
+        # Results follow the order in which operation types first appear
+        results = [task.result() for task in tasks]
+        return _dump({"success": all(r["success"] for r in results), "results": results})
+
+    @mcp.tool()
+    @mcp_tool_errors("create_label")
     async def gmail_create_label(
         ctx: Context,
         name: str,
@@ -408,25 +624,19 @@ def register_management_tools(mcp: FastMCP):
         Returns:
             JSON string with created label information
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
-        try:
-            request = CreateLabelRequest(
-                name=name,
-                message_list_visibility=message_list_visibility,
-                label_list_visibility=label_list_visibility,
-            )
-
-            label = await gmail_service.create_label(request)
-
-            result = {
-                "success": True,
-                "label": label.model_dump(),
-                "message": f"Label '{name}' created successfully",
-            }
-
-            return json.dumps(result, indent=2, default=str)
-
-        except Exception as e:
-            logger.error(f"Error in create_label: {e}")
-            return json.dumps({"error": str(e), "success": False}, indent=2)
+        gmail_service: GmailService = await get_gmail_service(ctx)
+        request = CreateLabelRequest.model_construct(
+            name=name,
+            message_list_visibility=message_list_visibility,
+            label_list_visibility=label_list_visibility,
+        )
+
+        label = await gmail_service.create_label(request)
+
+        result = {
+            "success": True,
+            "label": orjson.Fragment(label.model_dump_json()),
+            "message": f"Label '{name}' created successfully",
+        }
+
+        return _dump(result)
@@ -10,7 +10,7 @@ from mcp.server.fastmcp.server import Context
 
 from ..services import GmailService
 from ..models import EmailListRequest, SearchEmailsRequest, MessageFormat
-from ..dependencies import get_access_token, get_gmail_service, parse_comma_separated_list
+from ..dependencies import get_gmail_service, parse_comma_separated_list
 
 
 logger = logging.getLogger(__name__)
@@ -61,15 +61,14 @@ def register_reading_tools(mcp: FastMCP):
             - RAW: Raw RFC2822 message
             - METADATA: Headers and labels only (no body)
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = await get_gmail_service(ctx)
         try:
             logger.info(f"Fetching {max_results} emails with format {format}")
 
             # GmailService is injected with the access token already configured
 
             # Parse comma-separated label_ids into list
-            label_ids_list = parse_comma_separated_list(label_ids) or []
+            label_ids_list = list(parse_comma_separated_list(label_ids) or ())
 
             # Create request object
             email_request = EmailListRequest(
@@ -118,8 +117,7 @@ def register_reading_tools(mcp: FastMCP):
             - RAW: Raw RFC2822 message
             - METADATA: Headers and labels only (no body)
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = await get_gmail_service(ctx)
         try:
             logger.info(f"Fetching email {email_id} with format {format}")
 
@@ -173,13 +171,12 @@ def register_reading_tools(mcp: FastMCP):
             - RAW: Raw RFC2822 message
             - METADATA: Headers and labels only (no body)
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = await get_gmail_service(ctx)
         try:
             logger.info(f"Searching emails with query: {query}, format: {format}")
 
             # Parse comma-separated label_ids into list
-            label_ids_list = parse_comma_separated_list(label_ids) or []
+            label_ids_list = list(parse_comma_separated_list(label_ids) or ())
 
             search_request = SearchEmailsRequest(
                 query=query,
@@ -213,8 +210,7 @@ def register_reading_tools(mcp: FastMCP):
         Returns:
             JSON string with labels list
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = await get_gmail_service(ctx)
         try:
             logger.info("Fetching Gmail labels")
 
@@ -239,8 +235,7 @@ def register_reading_tools(mcp: FastMCP):
         Returns:
             JSON string with profile information
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = await get_gmail_service(ctx)
         try:
             logger.info("Fetching Gmail profile")
 
@@ -288,8 +283,7 @@ def register_reading_tools(mcp: FastMCP):
             - RAW: Raw RFC2822 message
             - METADATA: Headers and labels only (no body)
         """
-        access_token: str = get_access_token(ctx)
-        gmail_service: GmailService = get_gmail_service(access_token=access_token)
+        gmail_service: GmailService = await get_gmail_service(ctx)
         try:
             logger.info(f"Fetching {max_results} sent emails with format {format}")
 
@@ -16,6 +16,8 @@ sys.path.insert(0, str(project_root))
 
 from gmail_mcp.core.config import TransportType, settings
 from gmail_mcp.auth import gmail_token_verifier
+from gmail_mcp.core.http import aclose_http_client
+from gmail_mcp.middleware import GmailAuthMiddleware
 from gmail_mcp.tools import (
     register_reading_tools,
     register_management_tools,
@@ -74,6 +76,9 @@ if settings.transport_type == TransportType.SSE:
 else:
     mcp_app = mcp.streamable_http_app()
 
+# Parse the bearer token once per request at the ASGI layer
+mcp_app.add_middleware(GmailAuthMiddleware)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -83,15 +88,19 @@ async def lifespan(app: FastAPI):
     logger.info("Token validation: Google tokeninfo endpoint")
     logger.info("Required scopes: gmail")   
 
-    if settings.transport_type == TransportType.STREAMABLE_HTTP:
-        # Use the session manager's run() context manager
-        async with mcp.session_manager.run():
-            yield
+    try:
+        if settings.transport_type == TransportType.STREAMABLE_HTTP:
+            # Use the session manager's run() context manager
+            async with mcp.session_manager.run():
+                yield
 
-    else:
-        yield
+        else:
+            yield
 
-    logger.info("Gmail MCP Server stopped")
+    finally:
+        # Close the HTTP client shared by token validation and Gmail API calls
+        await aclose_http_client()
+        logger.info("Gmail MCP Server stopped")
 
 
 # Create FastAPI app
@@ -126,7 +135,7 @@ async def root():
             "gmail_search_emails",
             "gmail_get_labels",
             "gmail_get_profile",
-            # Management tools (11/11)
+            # Management tools (18/18)
             "gmail_send_email",
             "gmail_reply_to_email",
             "gmail_mark_as_read",
@@ -136,9 +145,16 @@ async def root():
             "gmail_delete_email",
             "gmail_add_label",
             "gmail_remove_label",
+            "gmail_mark_as_read_bulk",
+            "gmail_mark_as_unread_bulk",
+            "gmail_archive_email_bulk",
+            "gmail_unarchive_email_bulk",
+            "gmail_add_label_bulk",
+            "gmail_remove_label_bulk",
+            "gmail_bulk_operations",
             "gmail_create_label",
             "gmail_forward_email",
-            # Advanced tools (9/9)
+            # Advanced tools (10/10)
             "gmail_move_to_folder",
             "gmail_get_threads",
             "gmail_get_thread_by_id",
@@ -147,6 +163,7 @@ async def root():
             "gmail_get_draft_by_id",
             "gmail_send_draft",
             "gmail_get_attachments",
+            "gmail_await_future",
         ],
         "authentication": {
             "type": "Bearer Token",
@@ -0,0 +1,163 @@
+"""Tests for the batch coalescer and its use by GmailService.batch_modify_messages."""
+
+import asyncio
+import json
+from typing import Hashable, List, Tuple
+
+import httpx
+import pytest
+
+from gmail_mcp.auth import TokenInfo
+from gmail_mcp.core import http
+from gmail_mcp.models import ModifyLabelsRequest
+from gmail_mcp.services import BatchCoalescer, GmailAPIError, GmailService
+
+
+class RecordingFlush:
+    """Flush callable that records its calls and fails for IDs in ``bad_ids``."""
+
+    def __init__(self, bad_ids: Tuple[str, ...] = (), status_code: int = 400):
+        self.calls: List[Tuple[Hashable, List[str]]] = []
+        self.bad_ids = bad_ids
+        self.status_code = status_code
+
+    async def __call__(self, key: Hashable, ids: List[str]) -> None:
+        self.calls.append((key, list(ids)))
+        if any(message_id in self.bad_ids for message_id in ids):
+            raise GmailAPIError(self.status_code, "Invalid id value")
+
+
+def _split_on_client_error(error: Exception) -> bool:
+    return isinstance(error, GmailAPIError) and error.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_concurrent_submits_with_same_key_are_merged() -> None:
+    flush = RecordingFlush()
+    coalescer = BatchCoalescer(flush)
+
+    await asyncio.gather(
+        coalescer.submit("read", ["a"]),
+        coalescer.submit("read", ["b", "c"]),
+        coalescer.submit("archive", ["d"]),
+    )
+
+    assert sorted(flush.calls) == [("archive", ["d"]), ("read", ["a", "b", "c"])]
+
+
+@pytest.mark.asyncio
+async def test_reaching_max_batch_flushes_without_waiting() -> None:
+    flush = RecordingFlush()
+    coalescer = BatchCoalescer(flush, max_batch=2, max_wait=60)
+
+    await asyncio.wait_for(
+        asyncio.gather(coalescer.submit("read", ["a"]), coalescer.submit("read", ["b"])),
+        timeout=1,
+    )
+
+    assert flush.calls == [("read", ["a", "b"])]
+
+
+@pytest.mark.asyncio
+async def test_id_error_retries_each_submitter_alone() -> None:
+    flush = RecordingFlush(bad_ids=("bad",))
+    coalescer = BatchCoalescer(flush, split_on=_split_on_client_error)
+
+    good, bad = await asyncio.gather(
+        coalescer.submit("read", ["good"]),
+        coalescer.submit("read", ["bad"]),
+        return_exceptions=True,
+    )
+
+    assert good is None
+    assert isinstance(bad, GmailAPIError)
+    assert flush.calls[0] == ("read", ["good", "bad"])
+    assert sorted(flush.calls[1:]) == [("read", ["bad"]), ("read", ["good"])]
+
+
+@pytest.mark.asyncio
+async def test_other_errors_fail_all_submitters_without_retry() -> None:
+    flush = RecordingFlush(bad_ids=("a",), status_code=429)
+    coalescer = BatchCoalescer(flush, split_on=_split_on_client_error)
+
+    results = await asyncio.gather(
+        coalescer.submit("read", ["a"]),
+        coalescer.submit("read", ["b"]),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, GmailAPIError) for result in results)
+    assert flush.calls == [("read", ["a", "b"])]
+
+
+@pytest.mark.asyncio
+async def test_merged_failures_are_not_split_by_default() -> None:
+    flush = RecordingFlush(bad_ids=("bad",))
+    coalescer = BatchCoalescer(flush)
+
+    results = await asyncio.gather(
+        coalescer.submit("read", ["good"]),
+        coalescer.submit("read", ["bad"]),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, GmailAPIError) for result in results)
+    assert len(flush.calls) == 1
+
+
+@pytest.fixture
+def gmail_requests(monkeypatch: pytest.MonkeyPatch) -> List[List[str]]:
+    """Route Gmail API calls to a mock that rejects batches containing "bad"."""
+    sent: List[List[str]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        ids = json.loads(request.content)["ids"]
+        sent.append(ids)
+        if "throttled" in ids:
+            return httpx.Response(429, json={"error": {"message": "Rate limit exceeded"}})
+        if "bad" in ids:
+            return httpx.Response(400, json={"error": {"message": "Invalid id value"}})
+        return httpx.Response(204)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(http, "_http_client", client)
+    return sent
+
+
+def _gmail_service() -> GmailService:
+    return GmailService(TokenInfo(access_token="token", email="", scope=""))
+
+
+@pytest.mark.asyncio
+async def test_batch_modify_splits_on_invalid_id(gmail_requests: List[List[str]]) -> None:
+    gmail_service = _gmail_service()
+    request = ModifyLabelsRequest(remove_label_ids=["UNREAD"])
+
+    good, bad = await asyncio.gather(
+        gmail_service.batch_modify_messages(["good"], request),
+        gmail_service.batch_modify_messages(["bad"], request),
+        return_exceptions=True,
+    )
+
+    assert good is None
+    assert isinstance(bad, GmailAPIError) and bad.message == "Invalid id value"
+    assert len(gmail_requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_modify_does_not_split_on_rate_limit(
+    gmail_requests: List[List[str]],
+) -> None:
+    gmail_service = _gmail_service()
+    request = ModifyLabelsRequest(remove_label_ids=["UNREAD"])
+    message_ids = ["throttled"] + [f"m{i}" for i in range(49)]
+
+    results = await asyncio.gather(
+        *(gmail_service.batch_modify_messages([m], request) for m in message_ids),
+        return_exceptions=True,
+    )
+
+    assert all(
+        isinstance(result, GmailAPIError) and result.status_code == 429 for result in results
+    )
+    assert len(gmail_requests) == 1